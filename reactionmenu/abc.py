@@ -29,7 +29,9 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
     Final,
+    FrozenSet,
     Generic,
     Iterable,
     List,
@@ -50,6 +52,7 @@ import abc
 import asyncio
 import collections
 import inspect
+import itertools
 import re
 import warnings
 from collections.abc import Sequence
@@ -295,9 +298,10 @@ class _BaseMenu(metaclass=abc.ABCMeta):
     TypeEmbed: Final[_MenuType] = _MenuType.TypeEmbed
     TypeEmbedDynamic: Final[_MenuType] = _MenuType.TypeEmbedDynamic
     TypeText: Final[_MenuType] = _MenuType.TypeText
+    _ALL_MENU_TYPES: Final[FrozenSet[_MenuType]] = frozenset((TypeEmbed, TypeEmbedDynamic, TypeText))
 
     _sessions_limit_details = _LimitDetails.default()
-    _active_sessions: List[Self] # initialized in child classes
+    _active_sessions: Dict[Self, None] # initialized in child classes. used as an insertion ordered set (O(1) add/remove, start order is kept for :meth:`stop_session()`)
 
     def __init__(self, method: Union[Context, discord.Interaction], /, menu_type: _MenuType, **kwargs):
         # `Context` has an `interaction` attribute. If that attribute is `None`,
@@ -310,6 +314,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         else:
             self._method = method # will be an interaction
 
+        self._owner: Union[discord.Member, discord.User] = self._extract_proper_user(self._method)
         self._menu_type = menu_type
 
         self._msg: Union[discord.Message, discord.InteractionMessage] # initialized in child classes
@@ -319,8 +324,8 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         self._page_director_separator = ":"
 
         # dynamic session
-        self._main_page_contents = collections.deque()
-        self._last_page_contents = collections.deque()
+        self._main_page_contents: List[discord.Embed] = []
+        self._last_page_contents: List[discord.Embed] = []
         self._dynamic_data_builder: List[str] = []
         self.wrap_in_codeblock: Optional[str] = kwargs.get('wrap_in_codeblock')
         self.rows_requested: int = kwargs.get('rows_requested', 0)
@@ -404,8 +409,13 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         -------
         >>> embeds, strings = .separate([...])
         """
-        all_embeds = list(filter(lambda item: isinstance(item, discord.Embed), values))
-        all_strings = list(filter(lambda item: isinstance(item, str), values))
+        all_embeds: List[discord.Embed] = []
+        all_strings: List[str] = []
+        for item in values:
+            if isinstance(item, discord.Embed):
+                all_embeds.append(item)
+            elif isinstance(item, str):
+                all_strings.append(item)
         return (all_embeds, all_strings)
     
     @staticmethod
@@ -423,7 +433,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         -------
         :class:`bool`: Can return `False` if the sequence is empty
         """
-        return all([isinstance(item, discord.Embed) for item in values]) if values else False
+        return all(isinstance(item, discord.Embed) for item in values) if values else False
     
     @staticmethod
     def _sort_buttons(buttons: List[GB]) -> List[GB]:
@@ -444,13 +454,19 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         -------
         :class:`bool`: Can return `False` if the sequence is empty
         """
-        return all([isinstance(item, str) for item in values]) if values else False
+        return all(isinstance(item, str) for item in values) if values else False
     
-    @staticmethod #* Don't make this an instance method. It would be better as one, but it's main intended use is for :meth:`_check` in "views_menu.py"
+    @staticmethod #* Only used in :meth:`__init__` to resolve :attr:`_owner` from the method the menu was created with
     def _extract_proper_user(method: Union[Context, discord.Interaction]) -> Union[discord.Member, discord.User]:
         """|static method| Get the proper :class:`discord.User` / :class:`discord.Member` from the attribute depending on the instance"""
         return method.author if isinstance(method, Context) else method.user
     
+    def _member_has_allowed_role(self, member: discord.Member) -> bool:
+        """Check if the member has any of the roles in :attr:`only_roles`. Used in :meth:`ReactionMenu.__wait_check()` and :meth:`ViewMenu._check()`"""
+        # :meth:`discord.Member.get_role` searches the member's sorted role IDs instead of building :attr:`discord.Member.roles` on every check. it doesn't
+        # include the guild's default role (@everyone), which shares the guild's ID and every member has, so that one is matched by ID
+        return any(role.id == member.guild.id or member.get_role(role.id) is not None for role in self.only_roles) # type: ignore / only called when :attr:`only_roles` is set
+    
     @classmethod
     def _quick_check(cls, pages: Sequence[Union[discord.Embed, str]]) -> _MenuType:
         """|class method| Verification for :meth:`quick_start()`"""
@@ -458,10 +474,6 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         if cls.all_strings(pages): return cls.TypeText
         raise IncorrectType(f'All items in the sequence were not of type discord.Embed or str')
     
-    @classmethod
-    def _all_menu_types(cls) -> Tuple[_MenuType, _MenuType, _MenuType]:
-        return (cls.TypeEmbed, cls.TypeEmbedDynamic, cls.TypeText)
-    
     @classmethod
     def remove_limit(cls) -> None:
         """|class method|
@@ -492,7 +504,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         -------
         A :class:`list` of menu sessions that are currently running. Can be an empty list if there are no active sessions
         """
-        return cls._active_sessions
+        return list(cls._active_sessions)
     
     @classmethod
     def get_session(cls, name: str) -> List[Self]:
@@ -600,7 +612,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         Stops all menu sessions that are currently running
         """
         while cls._active_sessions:
-            session = cls._active_sessions[0]
+            session = next(iter(cls._active_sessions))
             await session.stop()
     
     @classmethod
@@ -656,7 +668,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         -------
         Union[:class:`discord.Member`, :class:`discord.User`]: The owner of the menu (the person that started the menu). If the menu was started in a DM, this will return :class:`discord.User`
         """
-        return self._extract_proper_user(self._method)
+        return self._owner
     
     @property
     def total_pages(self) -> int:
@@ -709,55 +721,49 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         """
         return self._method.guild is None
     
-    def _chunks(self, list_: List[str], n: int) -> Iterable:
-        """Yield successive n-sized chunks from list. Core component of a dynamic menu"""
-        for i in range(0, len(list_), n):
-            yield list_[i:i + n]
-    
     async def _build_dynamic_pages(self, send_to, view: Optional[discord.ui.View]=None, payload: Optional[dict]=None) -> None:
         """|coro| Compile all the information that was given via :meth:`add_row`"""
-        for data_clump in self._chunks(self._dynamic_data_builder, self.rows_requested):
-            joined_data = '\n'.join(data_clump)
-            if len(joined_data) <= _DYNAMIC_EMBED_LIMIT:
-                possible_block = f"```{self.wrap_in_codeblock}\n{joined_data}```"
-                embed = discord.Embed() if self.custom_embed is None else self.custom_embed.copy()
-                embed.description = joined_data if not self.wrap_in_codeblock else possible_block
+        custom_embed = self.custom_embed
+        data = self._dynamic_data_builder
+        rows = self.rows_requested
+        
+        # the codeblock (if any) is the same for every page
+        if self.wrap_in_codeblock:
+            block_start, block_end = f"```{self.wrap_in_codeblock}\n", "```"
+        else:
+            block_start = block_end = ''
+        description_limit = _DYNAMIC_EMBED_LIMIT - len(block_start) - len(block_end)
+        
+        # each page is made of `rows_requested` rows of data
+        for i in range(0, len(data), rows):
+            joined_data = '\n'.join(data[i:i + rows])
+            if len(joined_data) <= description_limit:
+                embed = discord.Embed() if custom_embed is None else custom_embed.copy()
+                embed.description = block_start + joined_data + block_end
                 self._pages.append(Page(embed=embed))
             else:
                 raise DescriptionOversized('With the amount of data that was received, the embed description is over discords size limit. Lower the amount of "rows_requested" to solve this problem')
-        else:
-            def convert_to_page(main_last: Iterable[discord.Embed]) -> List[Page]:
-                """Initializing the :class:`deque` only supports :class:`discord.Embed`. This converts those embed objects to the supported :class:`Page` type for proper pagination"""
-                return [Page(embed=item) for item in main_last]
-            
-            # set the main/last pages if any
-            if any([self._main_page_contents, self._last_page_contents]):
-                
-                # convert to :class:`deque`
-                self._pages = collections.deque(self._pages) # type: ignore (only temporary to use extend methods of :class:`deque`)
-                
-                if self._main_page_contents:
-                    self._main_page_contents.reverse()
-                    self._pages.extendleft(convert_to_page(self._main_page_contents)) # type: ignore (converted to deque above)
-                
-                if self._last_page_contents:
-                    self._pages.extend(convert_to_page(self._last_page_contents))
-            
-            # convert back to `list`
-            self._pages = list(self._pages)
 
-            self._refresh_page_director_info(_BaseMenu.TypeEmbedDynamic, self._pages)
-            cls = self.__class__
+        def convert_to_page(main_last: Iterable[discord.Embed]) -> List[Page]:
+            """The main/last pages are stored as :class:`discord.Embed`. This converts those embed objects to the supported :class:`Page` type for proper pagination"""
+            return [Page(embed=item) for item in main_last]
+        
+        # set the main/last pages if any
+        if self._main_page_contents:
+            self._pages[:0] = convert_to_page(self._main_page_contents)
+        
+        if self._last_page_contents:
+            self._pages.extend(convert_to_page(self._last_page_contents))
 
-            # make sure data has been added to create at least 1 page
-            if not self._pages: raise NoPages(f'You cannot start a {cls.__name__} when no data has been added')
-            
-            payload['embed'] = self._pages[0].embed # type: ignore / - / reassign the first page to show to director information
-            
-            if view is None:
-                await self._handle_send_to(send_to, payload) # type: ignore
-            else:
-                await self._handle_send_to(send_to, payload) # type: ignore ("embed=" can still be `None`)
+        self._refresh_page_director_info(_BaseMenu.TypeEmbedDynamic, self._pages)
+        cls = self.__class__
+
+        # make sure data has been added to create at least 1 page
+        if not self._pages: raise NoPages(f'You cannot start a {cls.__name__} when no data has been added')
+        
+        payload['embed'] = self._pages[0].embed # type: ignore / - / reassign the first page to show to director information
+        
+        await self._handle_send_to(send_to, payload) # type: ignore ("embed=" can still be `None`)
     
     def _display_timeout_warning(self, error: Exception) -> None:
         """Simply displays a warning message to the user notifying them an error has occurred in the function they have set for when the menu times out"""
@@ -795,8 +801,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         kwargs = {
             "content" : page.content, # `content` will always be present because even with TypeEmbed menu's, pagination with the addition of text is possible
             "allowed_mentions" : self.allowed_mentions,
-            "attachments" : maybe_new_files, # the `edit_message` method for this has an "attachment" kwarg instead of a "files" parameter
-            "allowed_mentions" : self.allowed_mentions
+            "attachments" : maybe_new_files # the `edit_message` method for this has an "attachment" kwarg instead of a "files" parameter
         }
 
         # only add the "embed" key if its an embed type menu
@@ -815,42 +820,53 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         pages: List[:class:`Page`]
             The pagination contents
         """
-        if self.show_page_director:
-            if type_ not in (_BaseMenu.TypeEmbed, _BaseMenu.TypeEmbedDynamic, _BaseMenu.TypeText):
-                raise Exception('Needs to be of type _BaseMenu.TypeEmbed, _BaseMenu.TypeEmbedDynamic or _BaseMenu.TypeText') 
-            
-            page_number = 1
-
-            if type_ in (_BaseMenu.TypeEmbed, _BaseMenu.TypeEmbedDynamic):
-                page_number = 1
-                OUTOF: Final[int] = len(pages)
-                all_embeds = [p.embed for p in pages]
-                for embed in all_embeds:
-                    embed.set_footer(text=f'{self._maybe_new_style(page_number, OUTOF)}{self._page_director_separator if embed.footer.text else ""} {embed.footer.text if embed.footer.text else ""}', icon_url=embed.footer.icon_url) # type: ignore
-                    page_number += 1
-            else:
-                # TypeText Only
+        if not self.show_page_director:
+            return
+        
+        if type_ not in _BaseMenu._ALL_MENU_TYPES:
+            raise Exception('Needs to be of type _BaseMenu.TypeEmbed, _BaseMenu.TypeEmbedDynamic or _BaseMenu.TypeText') 
+        
+        # nothing to number (a menu with only custom embeds). the style shouldn't be validated for a director that's never shown
+        if not pages:
+            return
+        
+        template = self._page_director_template()
+        page_number = 1
 
-                CODEBLOCK = re.compile(r'(`{3})(.*?)(`{3})', flags=re.DOTALL)
-                CODEBLOCK_DATA_AFTER = re.compile(r'(`{3})(.*?)(`{3}).+', flags=re.DOTALL)
-                for idx in range(len(pages)):
-                    page: Page = pages[idx]
-                    page_info = self._maybe_new_style(page_number, len(pages))
-                    
-                    # the main purpose of the re is to decide if only 1 or 2 '\n' should be used. with codeblocks, at the end of the block there is already a new line, so there's no need to add an extra one except in
-                    # the case where there is more information after the codeblock
-                    
-                    # Note: with codeblocks, i already tried the f doc string version of this and it doesnt work because there is a spacing issue with page_info. using a normal f string with \n works as intended
-                    # f doc string version: https://github.com/Defxult/reactionmenu/blob/eb88af3a2a6dd468f7bcff38214eb77bc91b241e/reactionmenu/text.py#L288
-                    
-                    if re.search(CODEBLOCK, page.content): # type: ignore
-                        if re.search(CODEBLOCK_DATA_AFTER, page.content): # type: ignore
-                            page.content = f'{page.content}\n\n{page_info}'
-                        else:
-                            page.content = f'{page.content}\n{page_info}'
-                    else:
+        if type_ in (_BaseMenu.TypeEmbed, _BaseMenu.TypeEmbedDynamic):
+            page_number = 1
+            OUTOF: Final[int] = len(pages)
+            all_embeds = [p.embed for p in pages]
+            for embed in all_embeds:
+                footer = embed.footer
+                page_info = template.format(page_number, OUTOF)
+                text = f'{page_info}{self._page_director_separator} {footer.text}' if footer.text else f'{page_info} '
+                embed.set_footer(text=text, icon_url=footer.icon_url) # type: ignore
+                page_number += 1
+        else:
+            # TypeText Only
+
+            CODEBLOCK = re.compile(r'(`{3})(.*?)(`{3})', flags=re.DOTALL)
+            CODEBLOCK_DATA_AFTER = re.compile(r'(`{3})(.*?)(`{3}).+', flags=re.DOTALL)
+            OUTOF: Final[int] = len(pages)
+            for idx in range(OUTOF):
+                page: Page = pages[idx]
+                page_info = template.format(page_number, OUTOF)
+                
+                # the main purpose of the re is to decide if only 1 or 2 '\n' should be used. with codeblocks, at the end of the block there is already a new line, so there's no need to add an extra one except in
+                # the case where there is more information after the codeblock
+                
+                # Note: with codeblocks, i already tried the f doc string version of this and it doesnt work because there is a spacing issue with page_info. using a normal f string with \n works as intended
+                # f doc string version: https://github.com/Defxult/reactionmenu/blob/eb88af3a2a6dd468f7bcff38214eb77bc91b241e/reactionmenu/text.py#L288
+                
+                if re.search(CODEBLOCK, page.content): # type: ignore
+                    if re.search(CODEBLOCK_DATA_AFTER, page.content): # type: ignore
                         page.content = f'{page.content}\n\n{page_info}'
-                    page_number += 1
+                    else:
+                        page.content = f'{page.content}\n{page_info}'
+                else:
+                    page.content = f'{page.content}\n\n{page_info}'
+                page_number += 1
     
     async def _handle_session_limits(self) -> bool:
         """|coro| Determine if the menu session is currently limited, if so, send the error message and return `False` indicating that further code execution (starting the menu) should be cancelled
@@ -860,49 +876,36 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         """
         cls = self.__class__
         details = cls._sessions_limit_details
-        can_proceed = True
+        owner_id = self._owner.id
 
         # if the menu is in a DM, handle it separately
         if self.in_dms:
-            dm_sessions = cls.get_all_dm_sessions()
-            if dm_sessions:
-                user_dm_sessions = [session for session in dm_sessions if session.owner.id == self._extract_proper_user(self._method).id]
-                if len(user_dm_sessions) >= details.limit:
-                    can_proceed = False
+            limited_sessions = (session for session in cls._active_sessions if session.message.guild is None and session.owner.id == owner_id) # type: ignore
+        elif details.per == 'guild':
+            limited_sessions = (session for session in cls._active_sessions if session.message.guild is not None) # type: ignore
+        elif details.per == 'member':
+            limited_sessions = (session for session in cls._active_sessions if session.owner.id == owner_id)
+        elif details.per == 'channel':
+            limited_sessions = (session for session in cls._active_sessions if session.message.channel.id == self._method.channel.id) # type: ignore
         else:
-            if details.per == 'guild':
-                guild_sessions = [session for session in cls._active_sessions if session.message.guild is not None] # type: ignore
-                if len(guild_sessions) >= details.limit:
-                    can_proceed = False
-            
-            elif details.per == 'member':
-                member_sessions = [session for session in cls._active_sessions if session.owner.id == self._extract_proper_user(self._method).id]
-                if len(member_sessions) >= details.limit:
-                    can_proceed = False
-            
-            elif details.per == 'channel':
-                channel_sessions = [session for session in cls._active_sessions if session.message.channel.id == self._method.channel.id] # type: ignore
-                if len(channel_sessions) >= details.limit:
-                    can_proceed = False
+            return True
         
-        if can_proceed:
+        # only count as far as the limit, there's no need to know how far over it is
+        if sum(1 for _ in itertools.islice(limited_sessions, details.limit)) < details.limit:
             return True
         else:
             await self._method.channel.send(details.message) # type: ignore
             return False
     
-    def _maybe_new_style(self, counter: int, total_pages: int) -> str: 
-        """Sets custom page director styles"""
+    def _page_director_template(self) -> str:
+        """Validates the custom page director style (if set) and converts it to a :meth:`str.format` template. Field 0 is the page number and field 1 is the total amount of pages"""
         if self.style:
             if self.style.count('$') == 1 and self.style.count('&') == 1:
-                temp = self.style # copy it to a new variable so its not being changed in every call
-                temp = temp.replace('$', str(counter))
-                temp = temp.replace('&', str(total_pages))
-                return temp
+                return self.style.replace('{', '{{').replace('}', '}}').replace('$', '{0}').replace('&', '{1}')
             else:
                 raise ImproperStyleFormat
         else:
-            return f'Page {counter}/{total_pages}'
+            return 'Page {0}/{1}'
     
     async def _contact_relay(self, member: Union[discord.Member, discord.User], button: GB) -> None: # type: ignore
         """|coro| Dispatch the information to the relay function if a relay has been set"""
@@ -1138,14 +1141,15 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         - `MenuException`: An error occurred when attempting to fetch a message or not all :param:`message_ids` were of type int
         """
         if all([isinstance(ID, int) for ID in message_ids]):
-            to_paginate: List[discord.Message] = []            
-            for msg_id in message_ids:
+            async def fetch(msg_id: int) -> discord.Message:
                 try:
-                    fetched_message = await messageable.fetch_message(msg_id)
-                    to_paginate.append(fetched_message)
+                    return await messageable.fetch_message(msg_id)
                 except (discord.NotFound, discord.Forbidden, discord.HTTPException) as error:
                     raise MenuException(f'An error occurred when attempting to retrieve message with the ID {msg_id}: {error}')
             
+            # all messages are requested at once. the results are still in the same order as :param:`message_ids`
+            to_paginate: List[discord.Message] = await asyncio.gather(*[fetch(msg_id) for msg_id in message_ids])
+            
             if self._menu_type == _BaseMenu.TypeEmbed:
                 embeds_to_paginate: List[discord.Embed] = []
                 for msg in to_paginate:
@@ -1228,10 +1232,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         if self._menu_type != _BaseMenu.TypeEmbedDynamic: raise MenuSettingsMismatch('Method set_main_pages is only available for menus with menu_type TypeEmbedDynamic')
         
         # if they've set any values, remove it. Each set should be from the call and should not stack
-        self._main_page_contents.clear()
-        
-        for embed in embeds:
-            self._main_page_contents.append(embed)
+        self._main_page_contents = list(embeds)
 
     @ensure_not_primed
     def set_last_pages(self, *embeds: discord.Embed) -> None:
@@ -1254,10 +1255,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
         if self._menu_type != _BaseMenu.TypeEmbedDynamic: raise MenuSettingsMismatch('Method set_last_pages is only available for menus with menu_type TypeEmbedDynamic')
         
         # if they've set any values, remove it. Each set should be from the call and should not stack
-        self._last_page_contents.clear()
-        
-        for embed in embeds:
-            self._last_page_contents.append(embed)
+        self._last_page_contents = list(embeds)
     
     @ensure_not_primed
     def add_page(self, embed: Optional[discord.Embed]=MISSING, content: Optional[str]=None, files: Optional[List[discord.File]]=MISSING) -> None:
@@ -1287,7 +1285,7 @@ class _BaseMenu(metaclass=abc.ABCMeta):
                     Added parameter files
                     Removed parameter "page"
         """
-        if all([content is None, embed is None, files is None]):
+        if content is None and embed is None and files is None:
             raise MenuException("When adding a page, at lease one parameter must be set")
         
         cls = self.__class__
@@ -30,12 +30,12 @@ from typing import (
 	Callable,
 	Dict,
 	Final,
+	FrozenSet,
 	Iterable,
 	List,
 	Literal,
 	NamedTuple,
 	Optional,
-	Tuple,
 	Union
 )
 
@@ -113,6 +113,7 @@ class ViewButton(discord.ui.Button, _BaseButton):
 
 	_RE_IDs = r'[0-9]|[0-9]_\d+'
 	_RE_UNIQUE_ID_SET = r'_\d+'
+	_NAV_IDS: Final[FrozenSet[str]] = frozenset((ID_PREVIOUS_PAGE, ID_NEXT_PAGE, ID_GO_TO_FIRST_PAGE, ID_GO_TO_LAST_PAGE, ID_GO_TO_PAGE))
 
 	def __init__(
 		self,
@@ -248,8 +249,8 @@ class ViewButton(discord.ui.Button, _BaseButton):
 				raise IncorrectType('Parameter "func" must be callable')
 
 	@classmethod
-	def _base_nav_buttons(cls) -> Tuple[str, str, str, str, str]:
-		return (cls.ID_PREVIOUS_PAGE, cls.ID_NEXT_PAGE, cls.ID_GO_TO_FIRST_PAGE, cls.ID_GO_TO_LAST_PAGE, cls.ID_GO_TO_PAGE)
+	def _base_nav_buttons(cls) -> FrozenSet[str]:
+		return cls._NAV_IDS
 	
 	@classmethod
 	def _get_id_name_from_id(cls, id_: str, **kwargs) -> str:
@@ -508,6 +509,7 @@ class ReactionButton(_BaseButton):
 	"""
 
 	Type = ButtonType
+	_NAV_TYPES: Final[FrozenSet[ButtonType]] = frozenset((ButtonType.PREVIOUS_PAGE, ButtonType.NEXT_PAGE, ButtonType.GO_TO_FIRST_PAGE, ButtonType.GO_TO_LAST_PAGE, ButtonType.GO_TO_PAGE))
 
 	def __init__(self, *, emoji: str, linked_to: ReactionButton.Type, **kwargs):
 		super().__init__(name=kwargs.get('name'), event=kwargs.get('event'), skip=kwargs.get('skip')) # type: ignore
@@ -526,6 +528,10 @@ class ReactionButton(_BaseButton):
 	def __repr__(self):
 		return f'<ReactionButton emoji={self.emoji!r} linked_to={ButtonType._get_buttontype_name_from_type(self.linked_to)} total_clicks={self.total_clicks} name={self.name!r}>'
 	
+	@classmethod
+	def _base_nav_buttons(cls) -> FrozenSet[ButtonType]:
+		return cls._NAV_TYPES
+	
 	@property
 	def menu(self) -> Optional[ReactionMenu]:
 		"""
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from typing import TYPE_CHECKING, ClassVar, List, Literal, Optional, Sequence, Union, overload
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, List, Literal, Optional, Sequence, Tuple, Union, overload
 
 import discord
 from discord.ext.commands import Context
@@ -35,9 +35,9 @@ if TYPE_CHECKING:
 	from .abc import MenuType
 	from discord.ext.commands import Bot
 
-from .abc import DEFAULT_BUTTONS, _BaseMenu, _PageController
-from .buttons import ReactionButton
-from .decorators import ensure_not_primed
+from .abc import DEFAULT_BUTTONS, Page, _BaseMenu, _PageController
+from .buttons import ButtonType, ReactionButton
+from .decorators import ensure_not_primed, ensure_sessions_limit
 from .errors import *
 
 
@@ -104,7 +104,7 @@ class ReactionMenu(_BaseMenu):
 	NORMAL: ClassVar[str] = 'NORMAL'
 	FAST: ClassVar[str] = 'FAST'
 
-	_active_sessions: List[ReactionMenu] = []
+	_active_sessions: Dict[ReactionMenu, None] = {}
 
 	def __init__(self, method: Union[Context, discord.Interaction], /, *, menu_type: MenuType, **kwargs):
 		super().__init__(method, menu_type, **kwargs)
@@ -112,6 +112,8 @@ class ReactionMenu(_BaseMenu):
 		self.__buttons: List[ReactionButton] = []
 		
 		self.__main_session_task: Optional[asyncio.Task] = None
+		self.__sent_without_session = False # see :meth:`start()`, a single page menu can be sent without starting a session
+		self.__owner_id: int = self._owner.id # checked against every reaction, the owner never changes
 		
 		# kwargs
 		self.timeout: Union[float, int, None] = kwargs.get('timeout', 60.0)
@@ -120,7 +122,7 @@ class ReactionMenu(_BaseMenu):
 		self.__navigation_speed: str = kwargs.get('navigation_speed', ReactionMenu.NORMAL)
 	
 	def __repr__(self):
-		return f'<ReactionMenu name={self.name!r} owner={str(self._extract_proper_user(self._method))!r} is_running={self._is_running} timeout={self.timeout} menu_type={self._menu_type.name}>'
+		return f'<ReactionMenu name={self.name!r} owner={str(self._owner)!r} is_running={self._is_running} timeout={self.timeout} menu_type={self._menu_type.name}>'
 	
 	@property
 	def navigation_speed(self) -> str:
@@ -183,10 +185,6 @@ class ReactionMenu(_BaseMenu):
 		await menu.start()
 		return menu
 
-	def __extract_all_emojis(self) -> List[str]:
-		"""Return a list of all the emojis registered to each button. Can return an empty list if there are no buttons"""
-		return [button.emoji for button in self.__buttons]
-	
 	async def _handle_event(self, button: ReactionButton) -> None:
 		"""|coro| If an event is set, remove the buttons from the menu when the click requirement has been met"""
 		if button.event:
@@ -201,7 +199,7 @@ class ReactionMenu(_BaseMenu):
 	def _button_add_check(self, button: ReactionButton) -> None:
 		"""A set of checks to ensure the button can properly be added to the menu"""
 		if isinstance(button, ReactionButton):
-			if button.emoji not in self.__extract_all_emojis():
+			if not any(btn.emoji == button.emoji for btn in self.__buttons):
 				if button.linked_to == ReactionButton.Type.CUSTOM_EMBED and not button.custom_embed:
 					raise MissingSetting('When adding a button with the type "ReactionButton.Type.CUSTOM_EMBED", the kwarg "embed" is needed')
 				
@@ -234,8 +232,7 @@ class ReactionMenu(_BaseMenu):
 			pass
 		finally:
 			self._is_running = False # already set in :meth:`.stop()`, but just in case this was reached without that method being called
-			if self in ReactionMenu._active_sessions:
-				ReactionMenu._active_sessions.remove(self)
+			ReactionMenu._active_sessions.pop(self, None)
 	
 	@overload
 	def get_button(self, identity: str, *, search_by: Literal['name', 'emoji', 'type']='name') -> List[ReactionButton]:
@@ -365,31 +362,22 @@ class ReactionMenu(_BaseMenu):
 	
 	def __wait_check(self, reaction: discord.Reaction, user: Union[discord.Member, discord.User]) -> bool:
 		"""Predicate for :meth:`discord.Client.wait_for()`. This also handles :attr:`all_can_click`"""
-		not_bot = False
-		correct_msg = False
-		correct_user = False
-
-		if not user.bot:
-			not_bot = True
+		if user.bot or reaction.message.id != self._msg.id:
+			return False
 		
-		if reaction.message.id == self._msg.id:
-			correct_msg = True
-
+		# :attr:`only_roles` overrides :attr:`all_can_click`
 		if self.only_roles:
-			self.all_can_click = False
-			for role in self.only_roles:
-				if role in user.roles: # type: ignore / this will always have role objects (if the member has roles) because :attr:`only_roles` is overridden to `None` if the menu was sent in a DM
-					correct_user = True
-					break
-
-		if self.all_can_click:
-			correct_user = True
+			# this will always have role objects (if the member has roles) because :attr:`only_roles` is overridden to `None` if the menu was sent in a DM
+			if self._member_has_allowed_role(user): # type: ignore
+				return True
+		elif self.all_can_click:
+			return True
 		
-		menu_owner = self._extract_proper_user(self._method)
-		if user.id == menu_owner.id and not correct_user:
-			correct_user = True
-
-		return all([not_bot, correct_msg, correct_user])
+		return user.id == self.__owner_id
+	
+	def __go_to_page_check(self, message: discord.Message) -> bool:
+		"""Predicate for :meth:`discord.Client.wait_for()` when a :attr:`ReactionButton.Type.GO_TO_PAGE` button is pressed. Only the menu owner's reply in the menu's channel is accepted"""
+		return message.channel.id == self._msg.channel.id and message.author.id == self.__owner_id
 	
 	def __get_custom_embed_buttons(self) -> List[ReactionButton]:
 		"""Gets all custom embed buttons that have been set"""
@@ -400,145 +388,179 @@ class ReactionMenu(_BaseMenu):
 		if isinstance(self._method, Context): return self._method.bot
 		else: return self._method.client
 
-	async def __paginate(self, ready_event: asyncio.Event) -> None:
-		"""|coro| Handles the pagination process for all menu types"""
+	async def __add_reactions(self) -> None:
+		"""|coro| Add the reactions (buttons) to the menu message. All of them are dispatched at once, discord.py queues them under the same
+		rate limit bucket in the order they were registered so they still appear on the message in that order
+		"""
+		add_reaction = self._msg.add_reaction
+		await asyncio.gather(*[add_reaction(btn.emoji) for btn in self.__buttons])
+
+	async def __paginate(self, ready_event: asyncio.Event, *, add_reactions: bool=True) -> None:
+		"""|coro| Handles the pagination process for all menu types. If :param:`add_reactions` is `False`, the session only waits for the menu to time out or be stopped"""
 		
-		async def determine_removal(emoji: str, user: Union[discord.Member, discord.User]) -> None:
-			"""|coro| Determines if the reaction should be removed or not depending on the menus :attr:`navigation_speed`"""
+		async def determine_removal(emoji: str, user: Union[discord.Member, discord.User], button: ReactionButton) -> None:
+			"""|coro| Determines if the reaction should be removed or not depending on the menus :attr:`navigation_speed`, then handles the button's event if set.
+			The event can clear the button's reaction, so it has to come after the removal
+			"""
+			nonlocal buttons_by_emoji
 			if self.__navigation_speed != ReactionMenu.FAST and self._method.guild is not None:
 				await self._msg.remove_reaction(emoji, user)
-		
-		async def update_and_dispatch(emoji: str, user: Union[discord.Member, discord.User], button: ReactionButton) -> None:
-			"""|coro| Handle reaction removal for :attr:`navigation_speed`. Update the buttons statistics. Contact the relay if one was set and handle any events if set"""
-			btn._update_statistics(user)
-			await determine_removal(emoji, user)
 			await self._handle_event(button)
-			await self._contact_relay(user, button)
+			
+			# the event may have removed the button from the menu
+			if button not in self.__buttons:
+				buttons_by_emoji = {btn.emoji: btn for btn in self.__buttons}
 		
-		def proper_timeout() -> Optional[float]:
-			"""In :var:`wait_for_aws`, if the menu does not have a timeout (`Menu.timeout = None`), :class:`None` + :class:`float`, the float being "`self._timeout + 0.1`" from v1.0.5, will fail for obvious reasons. This checks if there is no timeout, 
-			and instead of adding those two together, simply return :class:`None` to avoid :exc:`TypeError`. This would happen if the menu's :attr:`Menu.navigation_speed` was set to :attr:`Menu.FAST` and
-			the :attr:`Menu.timeout` was set to :class:`None`
+		async def update_and_dispatch(emoji: str, user: Union[discord.Member, discord.User], button: ReactionButton, *, page: Optional[Page]=None) -> None:
+			"""|coro| Handle reaction removal for :attr:`navigation_speed`. Update the buttons statistics. Contact the relay if one was set and handle any events if set.
+			If a page is given, the menu message is edited to show that page (unless it's already being shown). All of these requests are independent of each other, so they're sent together
 			"""
-			if self.timeout is not None:
-				return self.timeout + 0.1
-			else:
-				return None
-
+			nonlocal displayed_page
+			button._update_statistics(user)
+			dispatches = [determine_removal(emoji, user, button), self._contact_relay(user, button)]
+			if page is not None and page is not displayed_page:
+				displayed_page = page
+				dispatches.append(self._msg.edit(**self._determine_kwargs(page)))
+			await asyncio.gather(*dispatches)
+		
 		# apply the reactions (buttons) to the menu message
-		for btn in self.__buttons:
-			await self._msg.add_reaction(btn.emoji)
+		if add_reactions:
+			await self.__add_reactions()
+		
+		client = self.__extract_proper_client()
+		menu_owner = self._owner
+		
+		# the page currently shown on the menu message. `None` if something other than a page is being shown (a custom embed)
+		displayed_page: Optional[Page] = self._pc.current_page if self._pages else None
+		
+		# CALLER buttons and whether their function is a coroutine function
+		caller_functions: Dict[ReactionButton, Tuple[Callable, bool]] = {}
+		
+		# buttons that only move the menu to another page
+		page_turners: Dict[ButtonType, Callable[[ReactionButton], Page]] = {
+			ButtonType.PREVIOUS_PAGE: lambda _: self._pc.prev(),
+			ButtonType.NEXT_PAGE: lambda _: self._pc.next(),
+			ButtonType.GO_TO_FIRST_PAGE: lambda _: self._pc.first_page(),
+			ButtonType.GO_TO_LAST_PAGE: lambda _: self._pc.last_page(),
+			ButtonType.SKIP: lambda button: self._pc.skip(button.skip)
+		}
 		
 		ready_event.set()
 		self._is_running = True
-		ReactionMenu._active_sessions.append(self)
-		registered_emojis = self.__extract_all_emojis()
-		client = self.__extract_proper_client()
-		menu_owner = self._extract_proper_user(self._method)
+		ReactionMenu._active_sessions[self] = None
 		
-		while self._is_running:
-			try:
-				if self.__navigation_speed == ReactionMenu.NORMAL:
-					reaction, user = await client.wait_for('reaction_add', check=self.__wait_check, timeout=self.timeout)
-				elif self.__navigation_speed == ReactionMenu.FAST:
-					add = asyncio.create_task(client.wait_for('reaction_add', check=self.__wait_check, timeout=self.timeout))
-					remove = asyncio.create_task(client.wait_for('reaction_remove', check=self.__wait_check, timeout=proper_timeout()) )
-					done, pending = await asyncio.wait([add, remove], return_when=asyncio.FIRST_COMPLETED)
-					
-					temp_pending: asyncio.Task = list(pending)[0]
+		# without reactions, no reaction is accepted and the session only ends by timing out or being stopped
+		reaction_check = self.__wait_check if add_reactions else lambda reaction, user: False
+		
+		# the navigation speed can't change once the menu has started, so pick how reactions are waited for once
+		if self.__navigation_speed == ReactionMenu.NORMAL:
+			async def wait_for_reaction() -> Tuple[discord.Reaction, Union[discord.Member, discord.User]]:
+				return await client.wait_for('reaction_add', check=reaction_check, timeout=self.timeout)
+		
+		elif self.__navigation_speed == ReactionMenu.FAST:
+			async def wait_for_reaction() -> Tuple[discord.Reaction, Union[discord.Member, discord.User]]:
+				add = asyncio.create_task(client.wait_for('reaction_add', check=reaction_check, timeout=self.timeout))
+				# with no timeout, there's nothing to add the 0.1 to
+				remove_timeout = self.timeout + 0.1 if self.timeout is not None else None
+				remove = asyncio.create_task(client.wait_for('reaction_remove', check=reaction_check, timeout=remove_timeout))
+				done, pending = await asyncio.wait([add, remove], return_when=asyncio.FIRST_COMPLETED)
+				
+				# both can finish in the same iteration, so there may be nothing left to cancel
+				for temp_pending in pending:
 					temp_pending.cancel()
 
-					temp_done: asyncio.Task = list(done)[0]
-					reaction, user = temp_done.result()
-				else:
-					raise ReactionMenuException(f'Navigation speed {self.__navigation_speed!r} is not recognized')
+				temp_done: asyncio.Task = done.pop()
+				return temp_done.result()
+		
+		else:
+			raise ReactionMenuException(f'Navigation speed {self.__navigation_speed!r} is not recognized')
+		
+		# the pressed button is looked up by its emoji. built from the buttons as they are now, since their emojis can be changed until the menu starts
+		buttons_by_emoji: Dict[str, ReactionButton] = {btn.emoji: btn for btn in self.__buttons}
+		
+		while self._is_running:
+			try:
+				reaction, user = await wait_for_reaction()
 			except (asyncio.TimeoutError, asyncio.CancelledError):
 				self._menu_timed_out = True
 				await self.stop(delete_menu_message=self.delete_on_timeout, clear_reactions=self.clear_reactions_after)
 			else:
 				emoji = str(reaction.emoji)
 
-				if self.remove_extra_reactions and emoji not in registered_emojis:
+				if self.remove_extra_reactions and emoji not in buttons_by_emoji:
 					if not self.in_dms:
 						await self._msg.clear_reaction(emoji)
 						continue
 
-				for btn in self.__buttons:
-					# previous
-					if emoji == btn.emoji and btn.linked_to == ReactionButton.Type.PREVIOUS_PAGE:
-						await self._msg.edit(**self._determine_kwargs(self._pc.prev()))
-						await update_and_dispatch(emoji, user, btn)
-					
-					# next
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.NEXT_PAGE:
-						await self._msg.edit(**self._determine_kwargs(self._pc.next()))
-						await update_and_dispatch(emoji, user, btn)
-					
-					# first page
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.GO_TO_FIRST_PAGE:
-						await self._msg.edit(**self._determine_kwargs(self._pc.first_page()))
-						await update_and_dispatch(emoji, user, btn)
-					
-					# last page
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.GO_TO_LAST_PAGE:
-						await self._msg.edit(**self._determine_kwargs(self._pc.last_page()))
-						await update_and_dispatch(emoji, user, btn)
+				btn = buttons_by_emoji.get(emoji)
+				if btn is None:
+					continue
+				
+				linked_to = btn.linked_to
+				
+				# previous, next, first page, last page, skip
+				turn_page = page_turners.get(linked_to)
+				if turn_page is not None:
+					await update_and_dispatch(emoji, user, btn, page=turn_page(btn))
+				
+				# go to page
+				elif linked_to == ButtonType.GO_TO_PAGE:
+					prompt: discord.Message = await self._msg.channel.send(f'{menu_owner.display_name}, what page would you like to go to?')
+					try:
+						selection_message: discord.Message = await client.wait_for('message', check=self.__go_to_page_check, timeout=self.timeout)
+						page = int(selection_message.content)
+					except (asyncio.TimeoutError, ValueError):
+						# dont call :meth:`.stop()` here because I want the timeout factor to only be applicable after the
+						# original reactions were added
+						continue
+					else:
+						if 1 <= page <= len(self._pages):
+							self._pc.index = page - 1
+							displayed_page = self._pc.current_page
+							await self._msg.edit(**self._determine_kwargs(displayed_page))
+							if self.delete_interactions:
+								await asyncio.gather(prompt.delete(), selection_message.delete())
+							
+							await update_and_dispatch(emoji, user, btn)
+				
+				# end session
+				elif linked_to == ButtonType.END_SESSION:
+					# the menu message is about to be deleted, so removing the reaction or handling the button's event (which clears its reaction) would be wasted requests
+					btn._update_statistics(user)
+					await self._contact_relay(user, btn)
+					await self.stop(delete_menu_message=True)
+				
+				# caller buttons
+				elif linked_to == ButtonType.CALLER:
+					func = btn.details.func # type: ignore / details member "func" is mandatory
+					args = btn.details.args # type: ignore / details member "args" could be an iterable
+					kwargs = btn.details.kwargs # type: ignore / details member "kwargs" could be an dict
 					
-					# skip
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.SKIP:
-						await self._msg.edit(**self._determine_kwargs(self._pc.skip(btn.skip)))
-						await update_and_dispatch(emoji, user, btn)
+					# only inspect the function again if the button's details were changed since it was last pressed
+					caller_info = caller_functions.get(btn)
+					if caller_info is None or caller_info[0] is not func:
+						caller_info = caller_functions[btn] = (func, inspect.iscoroutinefunction(func))
 					
-					# go to page
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.GO_TO_PAGE:
-						prompt: discord.Message = await self._msg.channel.send(f'{menu_owner.display_name}, what page would you like to go to?')
-						try:
-							selection_message: discord.Message = await client.wait_for('message', check=lambda m: all([m.channel.id == self._msg.channel.id, m.author.id == menu_owner.id]), timeout=self.timeout)
-							page = int(selection_message.content)
-						except (asyncio.TimeoutError, ValueError):
-							# dont call :meth:`.stop()` here because I want the timeout factor to only be applicable after the
-							# original reactions were added
-							continue
+					try:
+						if caller_info[1]:
+							await func(*args, **kwargs) # type: ignore / `func` is already confirmed to be a coroutine
 						else:
-							if 1 <= page <= len(self._pages):
-								self._pc.index = page - 1
-								await self._msg.edit(**self._determine_kwargs(self._pc.current_page))
-								if self.delete_interactions:
-									await prompt.delete()
-									await selection_message.delete()
-								
-								await update_and_dispatch(emoji, user, btn)
-					
-					# end session
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.END_SESSION:
+							func(*args, **kwargs)
+					except Exception as err:
+						raise ReactionMenuException(inspect.cleandoc(
+							f"""
+							A ReactionButton with a linked_to of ReactionButton.Type.CALLER raised an error during it's execution
+							-> {err.__class__.__name__}: {err}
+							"""
+						))
+					else:
 						await update_and_dispatch(emoji, user, btn)
-						await self.stop(delete_menu_message=True)
 					
-					# caller buttons
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.CALLER:
-						func = btn.details.func # type: ignore / details member "func" is mandatory
-						args = btn.details.args # type: ignore / details member "args" could be an iterable
-						kwargs = btn.details.kwargs # type: ignore / details member "kwargs" could be an dict
-						
-						try:
-							if inspect.iscoroutinefunction(func):
-								await func(*args, **kwargs) # type: ignore / `func` is already confirmed to be a coroutine
-							else:
-								func(*args, **kwargs)
-						except Exception as err:
-							raise ReactionMenuException(inspect.cleandoc(
-								f"""
-								A ReactionButton with a linked_to of ReactionButton.Type.CALLER raised an error during it's execution
-								-> {err.__class__.__name__}: {err}
-								"""
-							))
-						else:
-							await update_and_dispatch(emoji, user, btn)
-						
-					# custom buttons
-					elif emoji == btn.emoji and btn.linked_to == ReactionButton.Type.CUSTOM_EMBED:
-						await update_and_dispatch(emoji, user, btn)
-						await self._msg.edit(embed=btn.custom_embed)
+				# custom buttons
+				elif linked_to == ButtonType.CUSTOM_EMBED:
+					await update_and_dispatch(emoji, user, btn)
+					displayed_page = None
+					await self._msg.edit(embed=btn.custom_embed)
 
 	async def stop(self, *, delete_menu_message: bool=False, clear_reactions: bool=False) -> None:
 		"""|coro|
@@ -568,8 +590,14 @@ class ReactionMenu(_BaseMenu):
 				raise discord_error
 			finally:
 				self._is_running = False
+				ReactionMenu._active_sessions.pop(self, None)
 				self._on_close_event.set()
 				self.__main_session_task.cancel() # type: ignore / task object would have been set by the time this is executed
+		
+		# there's no session to stop, but the message that was sent can still be deleted. no reactions were added, so there are none to clear
+		elif self.__sent_without_session and delete_menu_message:
+			self.__sent_without_session = False
+			await self._msg.delete()
 	
 	def _override_dm_settings(self) -> None:
 		"""If a menu session is in a direct message the following settings are disabled/changed because of discord limitations and resource/safety reasons"""
@@ -624,11 +652,18 @@ class ReactionMenu(_BaseMenu):
 		...
 	
 	@ensure_not_primed
+	@ensure_sessions_limit
 	async def start(self, *, send_to: Optional[Union[str, int, discord.TextChannel, discord.VoiceChannel, discord.Thread]]=None, reply: bool=False) -> None:
 		"""|coro|
 		
 		Start the menu
 
+			.. note::
+				If the menu only has a single page and all of its buttons are base navigation buttons, there is nothing to paginate so no reactions are added.
+				If there's also nothing to do when the menu times out (:attr:`delete_on_timeout` is `False` and no :meth:`set_on_timeout` function is set), a session is not started.
+				Without a session, :attr:`is_running` is `False` and the menu isn't returned by :meth:`get_menu_from_message()`, :meth:`get_all_sessions()` or the other session methods, and it
+				doesn't count towards :meth:`set_sessions_limit()`. :meth:`stop()` can still be used with `delete_menu_message=True` to delete the menu's message
+
 		Parameters
 		----------
 		send_to: Optional[Union[:class:`str`, :class:`int`, :class:`discord.TextChannel`, :class:`discord.VoiceChannel`, :class:`discord.Thread`]]
@@ -650,14 +685,9 @@ class ReactionMenu(_BaseMenu):
 		- `IncorrectType`: Parameter :param:`send_to` was not of the expected type
 		- `MenuException`: The channel set in :param:`send_to` was not found
 		"""
-		if ReactionMenu._sessions_limit_details.set_by_user:
-			can_proceed = await self._handle_session_limits()
-			if not can_proceed:
-				return
-		
 		self._override_dm_settings()
 		
-		if self._menu_type not in ReactionMenu._all_menu_types():
+		if self._menu_type not in ReactionMenu._ALL_MENU_TYPES:
 			raise ReactionMenuException('ReactionMenu menu_type not recognized')
 		if not self.__buttons:
 			raise NoButtons
@@ -671,20 +701,17 @@ class ReactionMenu(_BaseMenu):
 		if self._menu_type == ReactionMenu.TypeEmbed:
 			if self._pages:
 				self._refresh_page_director_info(self._menu_type, self._pages)
-			
-			custom_embed_buttons = self.__get_custom_embed_buttons()
-			# no pages and no custom embeds (no pages at all)
-			if not self._pages and not custom_embed_buttons:
-				raise NoPages	
-
-			# only custom embeds
-			if not self._pages and custom_embed_buttons:
+			else:
+				custom_embed_buttons = self.__get_custom_embed_buttons()
+				
+				# no pages and no custom embeds (no pages at all)
+				if not custom_embed_buttons:
+					raise NoPages
+				
+				# only custom embeds
 				menu_payload['embed'] = custom_embed_buttons[0].custom_embed
-				await self._handle_send_to(send_to, menu_payload)
 			
-			# normal pages, no custom embeds
-			else:
-				await self._handle_send_to(send_to, menu_payload)
+			await self._handle_send_to(send_to, menu_payload)
 		
 		elif self._menu_type == ReactionMenu.TypeText:
 			if not self._pages:
@@ -698,8 +725,21 @@ class ReactionMenu(_BaseMenu):
 			# page director info is refreshed in method
 			await self._build_dynamic_pages(send_to, payload=menu_payload)
 
-		ready_event = asyncio.Event()
 		self._pc = _PageController(self._pages)
-		self.__main_session_task = self.__extract_proper_client().loop.create_task(self.__paginate(ready_event))
+
+		# with only one page, navigation buttons have nowhere to go. unless there's a relay to notify, the reactions aren't added
+		nothing_to_paginate = False
+		if len(self._pages) == 1 and self._relay_info is None:
+			nav_types = ReactionButton._base_nav_buttons()
+			nothing_to_paginate = all(btn.linked_to in nav_types for btn in self.__buttons)
+		
+		# if there's also nothing to do on timeout, skip the session entirely. otherwise a session is still needed to handle the timeout
+		if nothing_to_paginate and not self.delete_on_timeout and self._on_timeout_details is None:
+			self.__sent_without_session = True
+			self._on_close_event.set()
+			return
+
+		ready_event = asyncio.Event()
+		self.__main_session_task = self.__extract_proper_client().loop.create_task(self.__paginate(ready_event, add_reactions=not nothing_to_paginate))
 		self.__main_session_task.add_done_callback(self._session_done_callback)
 		await ready_event.wait()
@@ -52,3 +52,16 @@ def ensure_not_primed(func):
             else:
                 raise MenuAlreadyRunning(f'You cannot use method "{func.__name__}" after the menu has started. Menu name: {inst.name!r}')
         return wrapper
+
+
+def ensure_sessions_limit(func):
+    """Before the menu starts, make sure the limit set via :meth:`set_sessions_limit()` has not been reached. If it has, the menu is not started"""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        inst = args[0]
+        if inst._sessions_limit_details.set_by_user:
+            can_proceed = await inst._handle_session_limits()
+            if not can_proceed:
+                return
+        return await func(*args, **kwargs)
+    return wrapper
@@ -59,7 +59,7 @@ from .abc import (
     _PageController
 )
 
-from .decorators import ensure_not_primed
+from .decorators import ensure_not_primed, ensure_sessions_limit
 from .errors import *
 
 _SelectOptionRelayPayload = collections.namedtuple('_SelectOptionRelayPayload', ['func', 'only'])
@@ -250,7 +250,7 @@ class ViewMenu(_BaseMenu):
         The discord codeblock language identifier to wrap your data in (:attr:`ViewMenu.TypeEmbedDynamic` only/defaults to :class:`None`). Example: `ViewMenu(ctx, ..., wrap_in_codeblock='py')`
     """
     
-    _active_sessions: List[ViewMenu] = []
+    _active_sessions: Dict[ViewMenu, None] = {}
     
     def __init__(self, method: Union[Context, discord.Interaction], /, *, menu_type: MenuType, **kwargs):
         super().__init__(method, menu_type, **kwargs)
@@ -274,7 +274,7 @@ class ViewMenu(_BaseMenu):
         self._gotos: List[ViewSelect.GoTo] = []
     
     def __repr__(self):
-        return f'<ViewMenu name={self.name!r} owner={str(self._extract_proper_user(self._method))!r} is_running={self._is_running} timeout={self.timeout} menu_type={self._menu_type.name}>'
+        return f'<ViewMenu name={self.name!r} owner={str(self._owner)!r} is_running={self._is_running} timeout={self.timeout} menu_type={self._menu_type.name}>'
 
     async def _on_dpy_view_timeout(self) -> None:
         self._menu_timed_out = True
@@ -387,19 +387,14 @@ class ViewMenu(_BaseMenu):
     
     def _check(self, inter: discord.Interaction) -> bool:
         """Base menu button interaction check. Verifies who (user, everyone, or role) can interact with the button"""
-        author_pass = False
-        if self._extract_proper_user(inter).id == self.owner.id: author_pass = True
-        if self.only_roles: self.all_can_click = False
-
+        # :attr:`only_roles` overrides :attr:`all_can_click`
         if self.only_roles:
-            for role in self.only_roles:
-                if role in inter.user.roles: # type: ignore / will be :class:`discord.Member`. :attr:`only_roles` will always be `None` because of overridden DM settings so this line will never be reached
-                    author_pass = True
-                    break
-        if self.all_can_click:
-            author_pass = True
+            if self._member_has_allowed_role(inter.user): # type: ignore / will be :class:`discord.Member`. :attr:`only_roles` will always be `None` because of overridden DM settings so this line will never be reached
+                return True
+        elif self.all_can_click:
+            return True
 
-        return author_pass
+        return inter.user.id == self._owner.id
     
     async def _handle_event(self, button: ViewButton) -> None:
         """|coro| If an event is set, disable/remove the buttons from the menu when the click requirement has been met"""
@@ -931,9 +926,8 @@ class ViewMenu(_BaseMenu):
             
             # ensure there are no duplicate custom_ids for the base navigation buttons
             # Note: there's no need to have a check for buttons that are not navigation buttons because they have a unique ID and duplicates of those are allowed
-            active_button_ids: List[str] = [btn.custom_id for btn in self.__buttons] # type: ignore
-            if button.custom_id in active_button_ids:
-                if not all([button.custom_id is None, button.style == discord.ButtonStyle.link]):
+            if any(btn.custom_id == button.custom_id for btn in self.__buttons):
+                if not (button.custom_id is None and button.style == discord.ButtonStyle.link):
                     name = ViewButton._get_id_name_from_id(button.custom_id)
                     raise ViewMenuException(f'A ViewButton with custom_id {name!r} has already been added')
             
@@ -1069,7 +1063,7 @@ class ViewMenu(_BaseMenu):
             await inter.response.defer()
             prompt: discord.Message = await self._msg.channel.send(f'{inter.user.display_name}, what page would you like to go to?') # type: ignore / `.channel` is known at this point
             try:
-                selection_message: discord.Message = await inter.client.wait_for('message', check=lambda m: all([m.channel.id == self._msg.channel.id, m.author.id == inter.user.id]), timeout=self.timeout) # type: ignore / `.channel` is known at this point
+                selection_message: discord.Message = await inter.client.wait_for('message', check=lambda m: m.channel.id == self._msg.channel.id and m.author.id == inter.user.id, timeout=self.timeout) # type: ignore / `.channel` is known at this point
                 page = int(selection_message.content)
             except (asyncio.TimeoutError, ValueError):
                 return
@@ -1078,8 +1072,7 @@ class ViewMenu(_BaseMenu):
                     self._pc.index = page - 1
                     await self._msg.edit(**self._determine_kwargs(self._pc.current_page))
                     if self.delete_interactions:
-                        await prompt.delete()
-                        await selection_message.delete()
+                        await asyncio.gather(prompt.delete(), selection_message.delete())
         
         elif button.custom_id == ViewButton.ID_END_SESSION:
             await self.stop(delete_menu_message=True)
@@ -1229,8 +1222,7 @@ class ViewMenu(_BaseMenu):
                 self.__view.stop()
                 self._is_running = False
 
-                if self in ViewMenu._active_sessions:
-                    ViewMenu._active_sessions.remove(self)
+                ViewMenu._active_sessions.pop(self, None)
                 
                 self._on_close_event.set()
                 await self._handle_on_timeout()
@@ -1287,6 +1279,7 @@ class ViewMenu(_BaseMenu):
         ...
     
     @ensure_not_primed
+    @ensure_sessions_limit
     async def start(self, *, send_to: Optional[Union[str, int, discord.TextChannel, discord.VoiceChannel, discord.Thread]]=None, reply: bool=False) -> None:
         """|coro|
         
@@ -1315,11 +1308,6 @@ class ViewMenu(_BaseMenu):
         - `IncorrectType`: Parameter :param:`send_to` was not of the expected type
         - `MenuException`: The channel set in :param:`send_to` was not found
         """
-        if ViewMenu._sessions_limit_details.set_by_user:
-            can_proceed = await self._handle_session_limits()
-            if not can_proceed:
-                return
-        
         self._override_dm_settings()
         
         # checks
@@ -1328,7 +1316,7 @@ class ViewMenu(_BaseMenu):
         
         # ensure at least 1 button exists before starting the menu
         if not self.__buttons: raise NoButtons
-        if self._menu_type not in ViewMenu._all_menu_types(): raise ViewMenuException('ViewMenu menu_type not recognized')
+        if self._menu_type not in ViewMenu._ALL_MENU_TYPES: raise ViewMenuException('ViewMenu menu_type not recognized')
 
         reply_kwargs = self._handle_reply_kwargs(send_to, reply)
         menu_payload = self.__generate_viewmenu_payload()
@@ -1340,7 +1328,8 @@ class ViewMenu(_BaseMenu):
         if self._menu_type == ViewMenu.TypeEmbed:
             self._refresh_page_director_info(ViewMenu.TypeEmbed, self._pages)
 
-            navigation_btns = [btn for btn in self.__buttons if btn.custom_id in ViewButton._base_nav_buttons()]
+            nav_ids = ViewButton._base_nav_buttons()
+            navigation_btns = [btn for btn in self.__buttons if btn.custom_id in nav_ids]
 
             # an re search is required here because buttons with ID_CUSTOM_EMBED dont have a normal ID, the ID is "8_[unique ID]"
             custom_embed_btns = [btn for btn in self.__buttons if btn.style != discord.ButtonStyle.link and re.search(r'8_\d+', btn.custom_id)] # type: ignore / raw string is compatible
@@ -1355,9 +1344,8 @@ class ViewMenu(_BaseMenu):
             # only custom embeds
             elif not self._pages and custom_embed_btns:
                 # since there are only custom embeds, there is no need for base navigation buttons, so remove them if any
-                for nav_btn in navigation_btns:
-                    if nav_btn in self.__buttons:
-                        self.__buttons.remove(nav_btn)
+                if navigation_btns:
+                    self.__buttons[:] = [btn for btn in self.__buttons if btn not in navigation_btns]
                 
                 # ensure all custom embed buttons have the proper values set
                 for custom_btn in custom_embed_btns:
@@ -1404,4 +1392,4 @@ class ViewMenu(_BaseMenu):
         
         self._pc = _PageController(self._pages)
         self._is_running = True
-        ViewMenu._active_sessions.append(self)
+        ViewMenu._active_sessions[self] = None